@@ -67,13 +67,14 @@ class AuthProvider with ChangeNotifier {
 
       // In real implementation, use google_sign_in package
       // For demo, create a Google user
+      final now = DateTime.now();
       _currentUser = UserModel(
-        id: DateTime.now().millisecondsSinceEpoch.toString(),
+        id: now.millisecondsSinceEpoch.toString(),
         name: 'Google User',
         email: 'user@gmail.com',
         phoneNumber: null,
         profileImageUrl: null, // In real app, get from Google
-        createdAt: DateTime.now(),
+        createdAt: now,
       );
 
       // Save login state
@@ -103,11 +104,12 @@ class AuthProvider with ChangeNotifier {
       // Simulate API call
       await Future.delayed(const Duration(seconds: 1));
 
+      final now = DateTime.now();
       _currentUser = UserModel(
-        id: DateTime.now().millisecondsSinceEpoch.toString(),
+        id: now.millisecondsSinceEpoch.toString(),
         name: name,
         email: email,
-        createdAt: DateTime.now(),
+        createdAt: now,
       );
 
       // Save login state
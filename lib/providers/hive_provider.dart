@@ -11,61 +11,83 @@ class HiveProvider with ChangeNotifier {
   bool get isOffline => _isOffline;
   bool get isLoading => _isLoading;
 
+  // Aggregates computed in a single pass over _hives (see _recomputeSummary)
+  Map<String, List<HiveModel>> _hivesByStatus = {};
+  Map<String, HiveModel> _hivesById = {};
+  int _totalAlerts = 0;
+  double _temperatureSum = 0.0;
+  double _humiditySum = 0.0;
+  double _weightSum = 0.0;
+
   // ✅ Existing getters (keeping for backward compatibility)
-  int get healthyHivesCount =>
-      _hives.where((hive) => hive.status == 'healthy').length;
+  int get healthyHivesCount => hivesWithStatus('healthy').length;
 
-  int get warningHivesCount =>
-      _hives.where((hive) => hive.status == 'warning').length;
+  int get warningHivesCount => hivesWithStatus('warning').length;
 
-  int get totalAlerts => _hives.fold(0, (sum, hive) => sum + hive.alerts);
+  int get totalAlerts => _totalAlerts;
 
   // ✅ NEW: Getters for Analytics and Map View screens
-  int get healthyHiveCount =>
-      _hives.where((hive) => hive.status == 'healthy').length;
+  int get healthyHiveCount => hivesWithStatus('healthy').length;
 
-  int get warningHiveCount =>
-      _hives.where((hive) => hive.status == 'warning').length;
+  int get warningHiveCount => hivesWithStatus('warning').length;
 
-  int get criticalHiveCount =>
-      _hives.where((hive) => hive.status == 'critical').length;
+  int get criticalHiveCount => hivesWithStatus('critical').length;
 
   // ✅ NEW: Average metrics for Analytics screen
-  double get averageTemperature {
-    if (_hives.isEmpty) return 0.0;
-    final total = _hives.fold<double>(0, (sum, hive) => sum + hive.temperature);
-    return total / _hives.length;
-  }
+  double get averageTemperature =>
+      _hives.isEmpty ? 0.0 : _temperatureSum / _hives.length;
 
-  double get averageHumidity {
-    if (_hives.isEmpty) return 0.0;
-    final total = _hives.fold<double>(0, (sum, hive) => sum + hive.humidity);
-    return total / _hives.length;
-  }
+  double get averageHumidity =>
+      _hives.isEmpty ? 0.0 : _humiditySum / _hives.length;
 
-  double get averageWeight {
-    if (_hives.isEmpty) return 0.0;
-    final total = _hives.fold<double>(0, (sum, hive) => sum + hive.weight);
-    return total / _hives.length;
-  }
+  double get averageWeight =>
+      _hives.isEmpty ? 0.0 : _weightSum / _hives.length;
 
   // ✅ NEW: Total hive count
   int get totalHives => _hives.length;
 
   // ✅ NEW: Get hives by status
-  List<HiveModel> get healthyHives =>
-      _hives.where((hive) => hive.status == 'healthy').toList();
+  List<HiveModel> get healthyHives => hivesWithStatus('healthy');
 
-  List<HiveModel> get warningHives =>
-      _hives.where((hive) => hive.status == 'warning').toList();
+  List<HiveModel> get warningHives => hivesWithStatus('warning');
 
-  List<HiveModel> get criticalHives =>
-      _hives.where((hive) => hive.status == 'critical').toList();
+  List<HiveModel> get criticalHives => hivesWithStatus('critical');
+
+  /// Hives with the given status, grouped once per data change
+  List<HiveModel> hivesWithStatus(String status) =>
+      _hivesByStatus[status] ?? const [];
 
   HiveProvider() {
     _loadMockData();
   }
 
+  /// Reindex hives by id and status and recompute metric sums in one pass.
+  /// Must be called whenever _hives changes.
+  void _recomputeSummary() {
+    final hivesByStatus = <String, List<HiveModel>>{};
+    final hivesById = <String, HiveModel>{};
+    var totalAlerts = 0;
+    var temperatureSum = 0.0;
+    var humiditySum = 0.0;
+    var weightSum = 0.0;
+
+    for (final hive in _hives) {
+      hivesByStatus.putIfAbsent(hive.status, () => []).add(hive);
+      hivesById.putIfAbsent(hive.id, () => hive);
+      totalAlerts += hive.alerts;
+      temperatureSum += hive.temperature;
+      humiditySum += hive.humidity;
+      weightSum += hive.weight;
+    }
+
+    _hivesByStatus = hivesByStatus;
+    _hivesById = hivesById;
+    _totalAlerts = totalAlerts;
+    _temperatureSum = temperatureSum;
+    _humiditySum = humiditySum;
+    _weightSum = weightSum;
+  }
+
   /// Load mock data for testing (replace with actual API call later)
   void _loadMockData() {
     _hives = [
@@ -130,6 +152,7 @@ class HiveProvider with ChangeNotifier {
         alerts: 0,
       ),
     ];
+    _recomputeSummary();
     notifyListeners();
   }
 
@@ -149,17 +172,12 @@ class HiveProvider with ChangeNotifier {
   }
 
   /// Get a specific hive by ID
-  HiveModel? getHiveById(String id) {
-    try {
-      return _hives.firstWhere((hive) => hive.id == id);
-    } catch (e) {
-      return null;
-    }
-  }
+  HiveModel? getHiveById(String id) => _hivesById[id];
 
   /// Add a new hive
   void addHive(HiveModel hive) {
     _hives.add(hive);
+    _recomputeSummary();
     notifyListeners();
   }
 
@@ -168,6 +186,7 @@ class HiveProvider with ChangeNotifier {
     final index = _hives.indexWhere((hive) => hive.id == updatedHive.id);
     if (index != -1) {
       _hives[index] = updatedHive;
+      _recomputeSummary();
       notifyListeners();
     }
   }
@@ -175,6 +194,7 @@ class HiveProvider with ChangeNotifier {
   /// Delete a hive
   void deleteHive(String id) {
     _hives.removeWhere((hive) => hive.id == id);
+    _recomputeSummary();
     notifyListeners();
   }
 
@@ -4,22 +4,36 @@ import '../models/recommendation_model.dart';
 /// Manages recommendations and alerts
 class RecommendationProvider with ChangeNotifier {
   List<RecommendationModel> _recommendations = [];
+  List<RecommendationModel> _activeRecommendations = [];
+  Map<String, int> _priorityCounts = {};
 
   List<RecommendationModel> get recommendations => _recommendations;
-  List<RecommendationModel> get activeRecommendations =>
-      _recommendations.where((r) => !r.isCompleted).toList();
+  List<RecommendationModel> get activeRecommendations => _activeRecommendations;
 
-  int get highPriorityCount =>
-      activeRecommendations.where((r) => r.priority == 'high').length;
-  int get mediumPriorityCount =>
-      activeRecommendations.where((r) => r.priority == 'medium').length;
-  int get lowPriorityCount =>
-      activeRecommendations.where((r) => r.priority == 'low').length;
+  int get highPriorityCount => _priorityCounts['high'] ?? 0;
+  int get mediumPriorityCount => _priorityCounts['medium'] ?? 0;
+  int get lowPriorityCount => _priorityCounts['low'] ?? 0;
 
   RecommendationProvider() {
     _loadDemoData();
   }
 
+  /// Rebuild the active list and per-priority tallies in one pass.
+  /// Must be called whenever a recommendation is added or completed.
+  void _recomputeActive() {
+    final active = <RecommendationModel>[];
+    final priorityCounts = <String, int>{};
+
+    for (final r in _recommendations) {
+      if (r.isCompleted) continue;
+      active.add(r);
+      priorityCounts[r.priority] = (priorityCounts[r.priority] ?? 0) + 1;
+    }
+
+    _activeRecommendations = active;
+    _priorityCounts = priorityCounts;
+  }
+
   /// Load demo recommendation data
   void _loadDemoData() {
     _recommendations = [
@@ -64,6 +78,7 @@ class RecommendationProvider with ChangeNotifier {
         time: '5 days ago',
       ),
     ];
+    _recomputeActive();
     notifyListeners();
   }
 
@@ -77,6 +92,7 @@ class RecommendationProvider with ChangeNotifier {
     final index = _recommendations.indexWhere((r) => r.id == id);
     if (index != -1) {
       _recommendations[index].markCompleted();
+      _recomputeActive();
       notifyListeners();
     }
   }
@@ -4,6 +4,17 @@ import 'package:fl_chart/fl_chart.dart';
 import '../providers/hive_provider.dart';
 import '../providers/recommendation_provider.dart';
 
+/// X-axis labels for the weekly trend chart
+const List<String> _weekdayLabels = [
+  'Mon',
+  'Tue',
+  'Wed',
+  'Thu',
+  'Fri',
+  'Sat',
+  'Sun',
+];
+
 /// Enhanced analytics screen with comprehensive data visualizations
 class AnalyticsScreen extends StatefulWidget {
   const AnalyticsScreen({super.key});
@@ -372,20 +383,12 @@ class _AnalyticsScreenState extends State<AnalyticsScreen> {
                       showTitles: true,
                       reservedSize: 30,
                       getTitlesWidget: (value, meta) {
-                        const days = [
-                          'Mon',
-                          'Tue',
-                          'Wed',
-                          'Thu',
-                          'Fri',
-                          'Sat',
-                          'Sun'
-                        ];
-                        if (value.toInt() >= 0 && value.toInt() < days.length) {
+                        final index = value.toInt();
+                        if (index >= 0 && index < _weekdayLabels.length) {
                           return Padding(
                             padding: const EdgeInsets.only(top: 8),
                             child: Text(
-                              days[value.toInt()],
+                              _weekdayLabels[index],
                               style: TextStyle(
                                 fontSize: 10,
                                 color: Colors.grey[600],
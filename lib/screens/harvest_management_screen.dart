@@ -311,7 +311,7 @@ class _HarvestManagementScreenState extends State<HarvestManagementScreen> {
   }
 
   Widget _buildHarvestHistory() {
-    final harvests = _getMockHarvests();
+    final harvests = _mockHarvests;
 
     return Column(
       crossAxisAlignment: CrossAxisAlignment.start,
@@ -454,45 +454,44 @@ class _HarvestManagementScreenState extends State<HarvestManagementScreen> {
     }
   }
 
-  List<Map<String, dynamic>> _getMockHarvests() {
-    return [
-      {
-        'hive': 'Hive Alpha',
-        'date': 'June 15, 2025',
-        'amount': 27.5,
-        'quality': 'Excellent',
-        'harvester': 'John Doe',
-      },
-      {
-        'hive': 'Hive Beta',
-        'date': 'May 28, 2025',
-        'amount': 20.0,
-        'quality': 'Good',
-        'harvester': 'John Doe',
-      },
-      {
-        'hive': 'Hive Gamma',
-        'date': 'May 10, 2025',
-        'amount': 25.0,
-        'quality': 'Excellent',
-        'harvester': 'Jane Smith',
-      },
-      {
-        'hive': 'Hive Delta',
-        'date': 'April 22, 2025',
-        'amount': 22.0,
-        'quality': 'Good',
-        'harvester': 'John Doe',
-      },
-      {
-        'hive': 'Hive Epsilon',
-        'date': 'April 5, 2025',
-        'amount': 18.0,
-        'quality': 'Average',
-        'harvester': 'Jane Smith',
-      },
-    ];
-  }
+  /// Mock harvest records (built once at compile time, not on every rebuild)
+  static const List<Map<String, dynamic>> _mockHarvests = [
+    {
+      'hive': 'Hive Alpha',
+      'date': 'June 15, 2025',
+      'amount': 27.5,
+      'quality': 'Excellent',
+      'harvester': 'John Doe',
+    },
+    {
+      'hive': 'Hive Beta',
+      'date': 'May 28, 2025',
+      'amount': 20.0,
+      'quality': 'Good',
+      'harvester': 'John Doe',
+    },
+    {
+      'hive': 'Hive Gamma',
+      'date': 'May 10, 2025',
+      'amount': 25.0,
+      'quality': 'Excellent',
+      'harvester': 'Jane Smith',
+    },
+    {
+      'hive': 'Hive Delta',
+      'date': 'April 22, 2025',
+      'amount': 22.0,
+      'quality': 'Good',
+      'harvester': 'John Doe',
+    },
+    {
+      'hive': 'Hive Epsilon',
+      'date': 'April 5, 2025',
+      'amount': 18.0,
+      'quality': 'Average',
+      'harvester': 'Jane Smith',
+    },
+  ];
 
   void _showAddHarvestDialog() {
     final hiveProvider = Provider.of<HiveProvider>(context, listen: false);
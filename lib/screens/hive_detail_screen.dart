@@ -6,6 +6,17 @@ import '../providers/hive_provider.dart';
 import '../providers/recommendation_provider.dart';
 import '../models/hive_model.dart';
 
+/// X-axis labels shared by the 7-day metric charts
+const List<String> _weekdayLabels = [
+  'Mon',
+  'Tue',
+  'Wed',
+  'Thu',
+  'Fri',
+  'Sat',
+  'Sun',
+];
+
 /// Detailed view of a single hive with visualizations and analytics
 class HiveDetailScreen extends StatefulWidget {
   final String hiveId;
@@ -599,10 +610,10 @@ class _TemperatureChart extends StatelessWidget {
                 showTitles: true,
                 reservedSize: 30,
                 getTitlesWidget: (value, meta) {
-                  const days = ['Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun'];
-                  if (value.toInt() >= 0 && value.toInt() < days.length) {
+                  final index = value.toInt();
+                  if (index >= 0 && index < _weekdayLabels.length) {
                     return Text(
-                      days[value.toInt()],
+                      _weekdayLabels[index],
                       style: const TextStyle(fontSize: 10, color: Colors.grey),
                     );
                   }
@@ -698,10 +709,10 @@ class _HumidityChart extends StatelessWidget {
                 showTitles: true,
                 reservedSize: 30,
                 getTitlesWidget: (value, meta) {
-                  const days = ['Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun'];
-                  if (value.toInt() >= 0 && value.toInt() < days.length) {
+                  final index = value.toInt();
+                  if (index >= 0 && index < _weekdayLabels.length) {
                     return Text(
-                      days[value.toInt()],
+                      _weekdayLabels[index],
                       style: const TextStyle(fontSize: 10, color: Colors.grey),
                     );
                   }
@@ -811,10 +822,10 @@ class _WeightChart extends StatelessWidget {
                 showTitles: true,
                 reservedSize: 30,
                 getTitlesWidget: (value, meta) {
-                  const days = ['Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun'];
-                  if (value.toInt() >= 0 && value.toInt() < days.length) {
+                  final index = value.toInt();
+                  if (index >= 0 && index < _weekdayLabels.length) {
                     return Text(
-                      days[value.toInt()],
+                      _weekdayLabels[index],
                       style: const TextStyle(fontSize: 10, color: Colors.grey),
                     );
                   }
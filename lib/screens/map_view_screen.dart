@@ -20,9 +20,7 @@ class _MapViewScreenState extends State<MapViewScreen> {
     final hiveProvider = Provider.of<HiveProvider>(context);
     final hives = _selectedFilter == 'all'
         ? hiveProvider.hives
-        : hiveProvider.hives
-        .where((h) => h.status == _selectedFilter)
-        .toList();
+        : hiveProvider.hivesWithStatus(_selectedFilter);
 
     return Scaffold(
       appBar: AppBar(